@@ -11,7 +11,7 @@ import sys
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
@@ -53,6 +53,9 @@ class Message:
 class Document(ABC):
     """An element of a collection, computed from topic messages"""
 
+    # Allows subclasses to be declared with slots=True
+    __slots__ = ()
+
     @property
     @abstractmethod
     def unique_key(self) -> tuple:
@@ -69,10 +72,19 @@ class Document(ABC):
         id_ = "_".join(unique_key_str)
         return id_
 
+    def _to_dict(self) -> dict:
+        """Returns the document fields as a dictionary, for both regular and slotted
+        subclasses. Slotted subclasses may hold cached values in non-init fields,
+        which are excluded"""
+        try:
+            return self.__dict__
+        except AttributeError:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
     def to_mongo_doc_sync(self) -> dict:
         """Converts the Document instance to a dictionary, adding '_key' and
         '_id' properties to help retrieving the right documents are query time"""
-        mongo_doc = self.__dict__
+        mongo_doc = self._to_dict()
         mongo_doc["_key"] = self._get_key_str()
         mongo_doc["_id"] = _generate_mongo_id_sync()
         return mongo_doc
@@ -80,7 +92,7 @@ class Document(ABC):
     async def to_mongo_doc_async(self) -> dict:
         """Converts the Document instance to a dictionary, adding '_key' and
         '_id' properties to help retrieving the right documents are query time"""
-        mongo_doc = self.__dict__
+        mongo_doc = self._to_dict()
         mongo_doc["_key"] = self._get_key_str()
         mongo_doc["_id"] = await _generate_mongo_id_async()
         return mongo_doc
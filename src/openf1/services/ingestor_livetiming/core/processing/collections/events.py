@@ -2,13 +2,14 @@ import hashlib
 import json
 import math
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Callable, Iterator, Literal, TypedDict
-
-import pytz
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Literal, TypedDict
 
 from openf1.services.ingestor_livetiming.core.objects import (
     Collection,
@@ -25,6 +26,70 @@ def _hash_obj(obj: dict) -> str:
     return hashlib.sha3_512(json.dumps(obj=obj, sort_keys=True).encode("utf-8")).hexdigest()
 
 
+# Patterns for extracting information from race control messages, compiled once at import time
+_INCIDENT_PATTERN = re.compile(
+    r"^"
+    r"(?:FIA\s+STEWARDS:\s+)?"
+    r"(?:(?P<marker>[A-Z0-9/\s]+?)\s+)?"                                                        # Captures marker if it exists
+    r"(?:LAP\s+(?P<lap_number>\d+)\s+)?"                                                        # Captures lap number if it exists
+    r"INCIDENT"
+    r"(?:\s+INVOLVING\s+CARS?\s+(?P<driver_numbers>(?:\d+\s+\(\w+\)(?:\s*,\s*|\s+AND\s+)?)+))?" # Captures driver numbers if they exist
+    r"\s+"
+    r"NOTED"
+    r"(?:\s+-\s+(?P<reason>.+))?"                                                               # Captures incident reason if it exists
+    r"$"
+)
+
+_TRACK_LIMITS_PATTERN = re.compile(
+    r"^"
+    r"CAR\s+(?P<driver_number>\d+).*?"      # Captures driver number
+    r"AT\s+(?P<marker>[A-Z0-9/\s]+)\s+"     # Captures marker
+    r"LAP\s+(?P<lap_number>\d+)\s+"         # Captures lap number
+    r"(?P<time>\b\d{1,2}:\d{2}:\d{2}\b).*"  # Captures local time
+    r"$"
+)
+
+# We need two patterns as penalty verdicts differ from others in structure
+_INCIDENT_VERDICT_PATTERN = re.compile(
+    r"^"
+    r"(?:FIA\s+STEWARDS:\s+)?"
+    r"(?:(?P<marker>[A-Z0-9/\s]+?)\s+)?"                                                        # Captures marker if it exists
+    r"INCIDENT"
+    r"(?:\s+INVOLVING\s+CARS?\s+(?P<driver_numbers>(?:\d+\s+\(\w+\)(?:\s*,\s*|\s+AND\s+)?)+))?" # Captures driver numbers if they exist
+    r"\s+"
+    r"(?P<verdict>[^-]+?)"                                                                      # Captures verdict
+    r"(?:\s*-\s*(?P<reason>.+))?"                                                               # Captures reason if it exists
+    r"$"
+)
+
+_PENALTY_VERDICT_PATTERN = re.compile(
+    r"^"
+    r"(?:FIA\s+STEWARDS:\s+)?"
+    r"(?P<verdict>.+?)"                                                                         # Captures verdict
+    r"\s+FOR\s+CAR\s+"
+    r"(?P<driver_number>\d+)\s+\(\w+\)"                                                         # Captures driver number
+    r"(?:\s*-\s*(?P<reason>.+))?"                                                               # Captures reason if it exists
+    r"$"
+)
+
+_DRIVER_FLAG_PATTERN = re.compile(r"CAR (?P<driver_number>\d+)")
+_SECTOR_PATTERN = re.compile(r"(?P<marker>SECTOR\s+\d+)")
+_DRIVER_NUMBERS_PATTERN = re.compile(r"\d+")
+
+# Matches single digit hours of formatted timedeltas
+_SINGLE_DIGIT_HOUR_PATTERN = re.compile(r"^(\d):")
+
+
+def _get_driver_numbers(driver_numbers: str | None) -> list[int]:
+    """
+    Returns the driver numbers listed in a captured group such as '1 (VER) AND 44 (HAM)',
+    otherwise an empty list.
+    """
+    if driver_numbers is None:
+        return []
+    return list(map(int, _DRIVER_NUMBERS_PATTERN.findall(driver_numbers)))
+
+
 def _get_elapsed_time(start: datetime, end: datetime) -> str | None:
     """
     Returns the elapsed time between start and end as a HH:MM:SS formatted string,
@@ -38,9 +103,144 @@ def _get_elapsed_time(start: datetime, end: datetime) -> str | None:
     # Handles underflow.
     if end < start:
         # Pad an extra 0 in front for single digit hours.
-        return "-" + re.sub(r'^(\d):', r'0\1:', str(start - end))
+        return "-" + _SINGLE_DIGIT_HOUR_PATTERN.sub(r'0\1:', str(start - end))
     
-    return re.sub(r'^(\d):', r'0\1:', str(end - start))
+    return _SINGLE_DIGIT_HOUR_PATTERN.sub(r'0\1:', str(end - start))
+
+
+# Read-only fallback for drivers without tracked data, avoids allocating an empty dict per lookup
+_NO_DRIVER_DATA = MappingProxyType({})
+
+# Driver role values shared by every emitted driver_roles mapping
+_ROLE_INITIATOR = sys.intern("initiator")
+_ROLE_PARTICIPANT = sys.intern("participant")
+
+# String forms of driver numbers, used as keys in driver roles
+_DRIVER_NUMBER_KEYS = {driver_number: str(driver_number) for driver_number in range(100)}
+
+
+def _get_driver_key(driver_number: int) -> str:
+    """
+    Returns the string form of a driver number, as used in driver roles.
+    """
+    return _DRIVER_NUMBER_KEYS.get(driver_number) or str(driver_number)
+
+
+@lru_cache(maxsize=1024)
+def _parse_utc(utc: str | None) -> datetime | None:
+    """
+    Returns a timezone-aware UTC datetime parsed from a race control timestamp, or None if it cannot be parsed.
+    Results are cached since the same timestamp is often repeated across consecutive messages.
+    """
+    date = to_datetime(utc)
+    return date.replace(tzinfo=timezone.utc) if date is not None else None
+
+
+def _get_latest_stint(driver_stints: dict) -> Any:
+    """
+    Returns the data of the highest numbered stint in a driver's stints.
+    Live updates usually only carry the latest stint, so the stint numbers (string keys) are only compared when there are several.
+    """
+    if len(driver_stints) == 1:
+        return next(iter(driver_stints.values()))
+    return driver_stints[max(driver_stints, key=int)]
+
+
+def _get_lap_time(data: dict, key: str) -> float | None:
+    """
+    Returns the lap time in seconds stored under the given key of a driver's timing data, or None if it is missing or malformed.
+    """
+    lap_time = data.get(key)
+    if not isinstance(lap_time, dict) or lap_time.get("Value") is None:
+        return None
+
+    lap_time = to_timedelta(str(lap_time.get("Value")))
+    return lap_time.total_seconds() if lap_time is not None else None
+
+
+# Known race control vocabulary, interned so that comparisons against incoming fields resolve on identity.
+_RACE_CONTROL_VOCABULARY = tuple(sys.intern(s) for s in (
+    "SAFETY CAR", "VIRTUAL SAFETY CAR", "DEPLOYED", "ENDING", "IN THIS LAP", "SafetyCar",
+    "YELLOW", "DOUBLE YELLOW", "CHEQUERED", "RED", "GREEN", "CLEAR", "BLUE", "Sector", "Track"
+))
+
+
+def _to_int(value: Any, default: int | None = None) -> int | None:
+    """
+    Returns value converted to an int, otherwise default.
+    Checks the value before converting since missing fields are common and raising exceptions for them is costly.
+    """
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return int(value) if math.isfinite(value) else default
+    if isinstance(value, str):
+        stripped = value.strip()
+        digits = stripped[1:] if stripped[:1] in ("+", "-") else stripped
+        if digits.isdecimal():
+            return int(stripped)
+    return default
+
+
+def _get_race_control_data(content: dict) -> dict:
+    """
+    Returns the first race control message of a RaceControlMessages message,
+    otherwise an empty dict.
+    Race control messages are nested under "Messages", either as a list or as a dict keyed by message number.
+    """
+    messages = content.get("Messages")
+
+    if isinstance(messages, dict):
+        data = next(iter(messages.values()), None)
+    elif isinstance(messages, list) and len(messages) > 0:
+        data = messages[0]
+    else:
+        data = None
+
+    return data if isinstance(data, dict) else {}
+
+
+def _intern(value: Any) -> Any:
+    """
+    Returns the interned value if it is a string, otherwise the value unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class _RaceControlFields:
+    """
+    Fields of a race control message, read once per message and shared between classification and processing.
+    Fields used for dispatch are interned.
+    """
+    message: str | None = None
+    utc: str | None = None
+    lap: Any = None
+    racing_number: Any = None
+    flag: str | None = None
+    category: str | None = None
+    mode: str | None = None
+    status: str | None = None
+    scope: str | None = None
+
+
+def _get_race_control_fields(content: dict) -> _RaceControlFields:
+    """
+    Returns the fields of the first race control message of a RaceControlMessages message.
+    """
+    data = _get_race_control_data(content)
+    utc = data.get("Utc")
+    return _RaceControlFields(
+        message=data.get("Message"),
+        utc=utc if isinstance(utc, str) else None,
+        lap=data.get("Lap"),
+        racing_number=data.get("RacingNumber"),
+        flag=_intern(data.get("Flag")),
+        category=_intern(data.get("Category")),
+        mode=_intern(data.get("Mode")),
+        status=_intern(data.get("Status")),
+        scope=_intern(data.get("Scope"))
+    )
 
 
 class EventCategory(str, Enum):
@@ -102,6 +302,34 @@ class EventCause(str, Enum):
     RACE_CONTROL_MESSAGE = "race-control-message"
 
 
+# Enum values bound once at import time since they are read for every emitted event
+_CATEGORY_DRIVER_ACTION = EventCategory.DRIVER_ACTION.value
+_CATEGORY_DRIVER_NOTIFICATION = EventCategory.DRIVER_NOTIFICATION.value
+_CATEGORY_SECTOR_NOTIFICATION = EventCategory.SECTOR_NOTIFICATION.value
+_CATEGORY_TRACK_NOTIFICATION = EventCategory.TRACK_NOTIFICATION.value
+_CATEGORY_SESSION_NOTIFICATION = EventCategory.SESSION_NOTIFICATION.value
+_CATEGORY_OTHER = EventCategory.OTHER.value
+
+_CAUSE_INCIDENT = EventCause.INCIDENT.value
+_CAUSE_OUT = EventCause.OUT.value
+_CAUSE_OVERTAKE = EventCause.OVERTAKE.value
+_CAUSE_PERSONAL_BEST_LAP = EventCause.PERSONAL_BEST_LAP.value
+_CAUSE_PIT = EventCause.PIT.value
+_CAUSE_TRACK_LIMITS = EventCause.TRACK_LIMITS.value
+_CAUSE_INCIDENT_VERDICT = EventCause.INCIDENT_VERDICT.value
+_CAUSE_PROVISIONAL_CLASSIFICATION = EventCause.PROVISIONAL_CLASSIFICATION.value
+_CAUSE_QUALIFYING_STAGE_CLASSIFICATION = EventCause.QUALIFYING_STAGE_CLASSIFICATION.value
+_CAUSE_RACE_CONTROL_MESSAGE = EventCause.RACE_CONTROL_MESSAGE.value
+
+# Maps safety car race control message modes and statuses to event causes
+_SAFETY_CAR_CAUSES = {
+    ("SAFETY CAR", "DEPLOYED"): EventCause.SAFETY_CAR_DEPLOYED,
+    ("VIRTUAL SAFETY CAR", "DEPLOYED"): EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED,
+    ("SAFETY CAR", "IN THIS LAP"): EventCause.SAFETY_CAR_ENDING,
+    ("VIRTUAL SAFETY CAR", "ENDING"): EventCause.VIRTUAL_SAFETY_CAR_ENDING
+}
+
+
 class EventDetails(TypedDict):
     """
     Event details can contain any of the following attributes:
@@ -181,7 +409,7 @@ class EventDetails(TypedDict):
     eliminated: bool | None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Event(Document):
     meeting_key: int
     session_key: int
@@ -190,14 +418,17 @@ class Event(Document):
     category: str
     cause: str
     details: EventDetails
+    _unique_key: tuple | None = field(default=None, init=False, repr=False) # Cached since hashing details is costly and the key is read for equality, hashing and ids
     
     @property
     def unique_key(self) -> tuple:
-        return (
-            self.date,
-            self.cause,
-            _hash_obj(self.details)
-        )
+        if self._unique_key is None:
+            self._unique_key = (
+                self.date,
+                self.cause,
+                _hash_obj(self.details)
+            )
+        return self._unique_key
 
 
 @dataclass
@@ -235,17 +466,63 @@ class EventsCollection(Collection):
     driver_locations: dict[int, dict[Literal["x", "y", "z"], int]] = field(default_factory=lambda: defaultdict(dict))
 
     # Track driver personal best times for qualifying
-    driver_personal_best_laps: dict[int, float] = field(default_factory=lambda: defaultdict(float))
+    driver_personal_best_laps: dict[int, float] = field(default_factory=dict)
 
     # Track latest driver positions
-    driver_positions: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    driver_positions: dict[int, int] = field(default_factory=dict)
+
+    # Maps source topics to the state updaters run before event detection
+    _topic_updaters: dict[str, Callable[[Message], None]] = field(init=False, repr=False)
+
+    # Maps message topics to event causes and their conditions, built once since conditions read state at call time
+    _event_conditions: dict[str, dict[EventCause, Callable[[Message], bool]]] = field(init=False, repr=False)
+
+    # Maps message topics to the dispatchers that find and process their events
+    _event_dispatchers: dict[str, Callable[[Message], Iterator[Event]]] = field(init=False, repr=False)
+
+    # Maps event causes to their processors, built once since the mapping does not depend on the message
+    _event_processors: dict[EventCause, Callable[[Message], Iterator[Event]]] = field(init=False, repr=False)
+
+
+    def __post_init__(self):
+        self._topic_updaters = {
+            "LapCount": self._update_lap_number,
+            # PitLaneTimeCollection acts as a fallback in case PitStopSeries doesn't exist or doesn't have a corresponding message
+            # Need to mark pit stop time as stale if latest pit date is not within some delta of message date for PitLaneTimeCollection
+            "PitLaneTimeCollection": self._update_driver_pits,
+            # Contains pit stop time, used from the 2024 US GP onwards
+            # Need to mark pit stop time as not stale
+            "PitStopSeries": self._update_driver_pits,
+            "Position.z": self._update_driver_locations,
+            "SessionData": self._update_session_data,
+            "SessionInfo": self._update_session_info,
+            "TimingAppData": self._update_driver_stints,
+            "TimingData": self._update_timing_data
+        }
+        self._event_conditions = self._get_event_condition_map()
+        self._event_processors = self._get_event_processing_map()
+        self._event_dispatchers = {
+            **{topic: self._dispatch_by_conditions for topic in self._event_conditions},
+            "RaceControlMessages": self._dispatch_race_control_message,
+            "SessionData": self._dispatch_session_data_message
+        }
+
+
+    def _update_session_data(self, message: Message):
+        self._update_session_stream_start(message)
+        if self.session_type == "Qualifying":
+            self._update_qualifying_stage_number(message)
+
+
+    def _update_timing_data(self, message: Message):
+        self._update_driver_personal_best_laps(message)
+        self._update_driver_positions(message)
 
 
     def _update_lap_number(self, message: Message):
         # Update current lap number
-        try:
-            lap_number = int(deep_get(obj=message.content, key="CurrentLap"))
-        except:
+        lap_number = _to_int(message.content.get("CurrentLap"))
+        if lap_number is None:
             return
         
         self.lap_number = lap_number
@@ -253,8 +530,7 @@ class EventsCollection(Collection):
 
     def _update_session_stream_start(self, message: Message):
         # Update session stream start if message indicates the session stream has started
-        cond = self._get_event_condition_map().get(EventCause.SESSION_START)
-        if cond is not None and cond(message):
+        if self._is_session_stream_start(message):
             self.session_stream_start = message.timepoint
             
 
@@ -269,10 +545,14 @@ class EventsCollection(Collection):
         if gmt_offset is None or session_type is None:
             return
         
+        session_start = to_datetime(str(data.get("StartDate")))
+        if session_start is None:
+            return
+
         try:
-            session_start = to_datetime(str(data.get("StartDate")))
             session_start = add_timezone_info(dt=session_start, gmt_offset=gmt_offset)
-        except:
+        except ValueError:
+            # Malformed GMT offset
             return
         
         self.session_start = session_start
@@ -281,10 +561,7 @@ class EventsCollection(Collection):
 
     
     def _update_session_status(self, message: Message):
-        try:
-            session_status = str(deep_get(obj=message.content, key="SessionStatus"))
-        except:
-            return
+        session_status = deep_get(obj=message.content, key="SessionStatus")
         
         if session_status not in ["Aborted", "Ends", "Finalised", "Finished", "Started"]:
             # Ignore "Inactive" status since it conflicts with event condition logic
@@ -294,10 +571,7 @@ class EventsCollection(Collection):
 
     
     def _update_qualifying_stage_number(self, message: Message):
-        try:
-            qualifying_stage_number = int(deep_get(obj=message.content, key="QualifyingPart"))
-        except:
-            return
+        qualifying_stage_number = _to_int(deep_get(obj=message.content, key="QualifyingPart"))
         
         if qualifying_stage_number not in [1, 2, 3]:
             return
@@ -305,20 +579,9 @@ class EventsCollection(Collection):
         self.qualifying_stage_number = qualifying_stage_number
 
 
-    def _update_driver_location(
-            self, driver_number: int,
-            key: Literal["x", "y", "z"],
-            value: int
-        ):
-        driver_position = self.driver_locations[driver_number] 
-        old_value = driver_position.get(key)
-        if value != old_value:
-            driver_position[key] = value
-            
-
     def _update_driver_locations(self, message: Message):
         # Update driver locations using the latest values
-        locations = deep_get(obj=message.content, key="Position")
+        locations = message.content.get("Position")
 
         if not isinstance(locations, list):
             return
@@ -328,167 +591,100 @@ class EventsCollection(Collection):
         if not isinstance(latest_locations, dict):
             return
         
-        latest_entries = deep_get(obj=latest_locations, key="Entries")
+        latest_entries = latest_locations.get("Entries")
 
         if not isinstance(latest_entries, dict):
             return
         
         for driver_number, data in latest_entries.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             if not isinstance(data, dict):
                 continue
             
-            try:
-                x = int(data.get("X"))
-                y = int(data.get("Y"))
-                z = int(data.get("Z"))
-            except:
+            x = _to_int(data.get("X"))
+            y = _to_int(data.get("Y"))
+            z = _to_int(data.get("Z"))
+            if x is None or y is None or z is None:
                 continue
 
-            self._update_driver_location(
-                driver_number=driver_number,
-                key="x",
-                value=x
-            )
-            self._update_driver_location(
-                driver_number=driver_number,
-                key="y",
-                value=y
-            )
-            self._update_driver_location(
-                driver_number=driver_number,
-                key="z",
-                value=z
-            )
+            self.driver_locations[driver_number].update(x=x, y=y, z=z)
 
                 
-    def _update_driver_stint(
-            self,
-            driver_number: int,
-            key: Literal["compound", "tyre_age_at_start"],
-            value: bool | int | str
-        ):
-        driver_stint = self.driver_stints[driver_number]
-        old_value = driver_stint.get(key)
-        if value != old_value:
-            driver_stint[key] = value
-            
-
     def _update_driver_stints(self, message: Message):
         # Update driver stints using the latest values
-        stints = deep_get(obj=message.content, key="Lines")
+        stints = message.content.get("Lines")
         
         if not isinstance(stints, dict):
             return
         
         for driver_number, data in stints.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             if not isinstance(data, dict):
                 continue
 
-            driver_stints = deep_get(obj=data, key="Stints")
+            driver_stints = data.get("Stints")
 
-            if not isinstance(driver_stints, dict) or len(driver_stints.keys()) == 0:
+            if not isinstance(driver_stints, dict) or not driver_stints:
                 continue
             
-            latest_stint_number = max(driver_stints.keys(), key=lambda stint_number: int(stint_number))
-            latest_stint_data = driver_stints.get(latest_stint_number)
+            latest_stint_data = _get_latest_stint(driver_stints)
 
             if not isinstance(latest_stint_data, dict):
                 continue
             
             # Conditional updates since not all stint messages are identical
+            stint_update = {}
             if "Compound" in latest_stint_data:
-                compound = str(latest_stint_data.get("Compound"))
+                stint_update["compound"] = str(latest_stint_data.get("Compound"))
+            tyre_age_at_start = _to_int(latest_stint_data.get("TotalLaps"))
+            if tyre_age_at_start is not None:
+                stint_update["tyre_age_at_start"] = tyre_age_at_start
 
-                self._update_driver_stint(
-                    driver_number=driver_number,
-                    key="compound",
-                    value=compound
-                )
-
-            if "TotalLaps" in latest_stint_data:
-                tyre_age_at_start = int(latest_stint_data.get("TotalLaps"))
-
-                self._update_driver_stint(
-                    driver_number=driver_number,
-                    key="tyre_age_at_start",
-                    value=tyre_age_at_start
-                )
+            if stint_update:
+                self.driver_stints[driver_number].update(stint_update)
 
     
-    def _update_driver_personal_best_lap(
-            self,
-            driver_number: int,
-            value: float
-        ):
-        old_value = self.driver_personal_best_laps.get(driver_number)
-        if value != old_value:
-            self.driver_personal_best_laps[driver_number] = value
-
-
     def _update_driver_personal_best_laps(self, message: Message) -> Iterator[Event]:
         # Update driver personal best lap times using the latest values
-        timing_data = deep_get(obj=message.content, key="Lines")
+        timing_data = message.content.get("Lines")
 
         if not isinstance(timing_data, dict):
             return
         
         for driver_number, data in timing_data.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
 
             if not isinstance(data, dict):
                 continue
 
-            try:
-                best_lap_time = to_timedelta(str(data.get("BestLapTime", {}).get("Value"))).total_seconds()
-            except:
-                continue
-
-            try:
-                last_lap_time = to_timedelta(str(data.get("LastLapTime", {}).get("Value"))).total_seconds()
-            except:
+            best_lap_time = _get_lap_time(data, "BestLapTime")
+            last_lap_time = _get_lap_time(data, "LastLapTime")
+            if best_lap_time is None or last_lap_time is None:
                 continue
 
             # Check for and compare lap times (up to thousandths precision)
             if math.isclose(a=best_lap_time, b=last_lap_time, rel_tol=1e-3):
-                self._update_driver_personal_best_lap(driver_number=driver_number, value=best_lap_time)
+                self.driver_personal_best_laps[driver_number] = best_lap_time
         
 
-    def _update_driver_pit(
-            self,
-            driver_number: int,
-            key: Literal["date", "pit_lane_duration", "pit_stop_duration", "pit_stop_duration_is_stale" "lap_number"],
-            value: bool | datetime | float | int
-        ):
-        driver_pit = self.driver_pits[driver_number]
-        old_value = driver_pit.get(key)
-        if value != old_value:
-            driver_pit[key] = value
-
-
     def _update_driver_pits(self, message: Message):
         # Update driver pits using the latest values
-        pit_data = deep_get(obj=message.content, key="PitTimes")
+        pit_data = message.content.get("PitTimes")
         
         if not isinstance(pit_data, dict):
             return
         
         for driver_number, data in pit_data.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             pit_lane_duration = deep_get(obj=data, key="PitLaneTime") or deep_get(obj=data, key="Duration")
@@ -498,38 +694,29 @@ class EventsCollection(Collection):
                 # Not a pit message
                 continue
             
+            lap_number = _to_int(lap_number)
+            if lap_number is None:
+                continue
+
             try:
                 pit_lane_duration = float(pit_lane_duration)
-                lap_number = int(lap_number)
-            except:
+            except (TypeError, ValueError):
                 continue
             
             # Mark pit stop duration as stale if latest pit date is not within 5 seconds of current (pit) message date
             # (i.e. the message is likely not about the same pit)
             # If the current message is about the same pit and contains a pit stop duration, pit stop duration should eventually be marked as not stale
-            latest_pit_date = self.driver_pits.get(driver_number, {}).get("date")
-            if abs(message.timepoint - latest_pit_date) > timedelta(seconds=5):
-                self._update_driver_pit(
-                    driver_number=driver_number,
-                    key="pit_stop_duration_is_stale",
-                    value=True
-                )
+            # A driver's first pit has no previous pit date to compare against
+            driver_pit = self.driver_pits[driver_number]
+            latest_pit_date = driver_pit.get("date")
+            if latest_pit_date is None or abs(message.timepoint - latest_pit_date) > timedelta(seconds=5):
+                driver_pit["pit_stop_duration_is_stale"] = True
 
             # Update pit data
-            self._update_driver_pit(
-                driver_number=driver_number,
-                key="date",
-                value=message.timepoint
-            )
-            self._update_driver_pit(
-                driver_number=driver_number,
-                key="pit_lane_duration",
-                value=pit_lane_duration
-            )
-            self._update_driver_pit(
-                driver_number=driver_number,
-                key="lap_number",
-                value=lap_number
+            driver_pit.update(
+                date=message.timepoint,
+                pit_lane_duration=pit_lane_duration,
+                lap_number=lap_number
             )
 
             # From 2024 US GP onwards, get the stationary time if it exists
@@ -538,104 +725,63 @@ class EventsCollection(Collection):
             if pit_stop_duration is not None:
                 try:
                     pit_stop_duration = float(pit_stop_duration)
-                except:
+                except (TypeError, ValueError):
                     continue
 
-                self._update_driver_pit(
-                    driver_number=driver_number,
-                    key="pit_stop_duration",
-                    value=pit_stop_duration
-                )
-
                 # Mark pit stop duration as not stale
-                self._update_driver_pit(
-                    driver_number=driver_number,
-                    key="pit_stop_duration_is_stale",
-                    value=False
+                driver_pit.update(
+                    pit_stop_duration=pit_stop_duration,
+                    pit_stop_duration_is_stale=False
                 )
 
 
-    def _update_driver_position(
-            self,
-            driver_number: int,
-            value: int
-        ):
-        old_value = self.driver_positions.get(driver_number)
-        if value != old_value:
-            self.driver_positions[driver_number] = value
-
-
     def _update_driver_positions(self, message: Message):
         # Update driver positions using the latest values
-        position_data = deep_get(obj=message.content, key="Lines")
+        position_data = message.content.get("Lines")
         
         if not isinstance(position_data, dict):
             return
         
         for driver_number, data in position_data.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             if not isinstance(data, dict):
                 continue
 
-            try:
-                position = int(data.get("Position"))
-            except:
+            position = _to_int(data.get("Position"))
+            if position is None:
                 continue
             
-            self._update_driver_position(driver_number=driver_number, value=position)
+            self.driver_positions[driver_number] = position
 
     
-    def _process_incident(self, message: Message) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_incident(self, message: Message, fields: _RaceControlFields) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
         
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
-            # Use UTC date as fallback
-            date = message.timepoint
-
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            # Use internal lap number as fallback
-            lap_number = self.lap_number
-        
-        # Extract incident information from race control message
-        incident_pattern = (
-            r"^"
-            r"(?:FIA\s+STEWARDS:\s+)?"
-            r"(?:(?P<marker>[A-Z0-9/\s]+?)\s+)?"                                                        # Captures marker if it exists
-            r"(?:LAP\s+(?P<lap_number>\d+)\s+)?"                                                        # Captures lap number if it exists
-            r"INCIDENT"
-            r"(?:\s+INVOLVING\s+CARS?\s+(?P<driver_numbers>(?:\d+\s+\(\w+\)(?:\s*,\s*|\s+AND\s+)?)+))?" # Captures driver numbers if they exist
-            r"\s+"
-            r"NOTED"
-            r"(?:\s+-\s+(?P<reason>.+))?"                                                               # Captures incident reason if it exists
-            r"$"
-        )
-        match = re.search(pattern=incident_pattern, string=race_control_message)
+        # Extract incident information from race control message, before anything else is parsed
+        match = _INCIDENT_PATTERN.search(race_control_message)
 
         if match is None:
             return
         
+        date = _parse_utc(fields.utc)
+        if date is None:
+            # Use UTC date as fallback
+            date = message.timepoint
+
+        # Use internal lap number as fallback
+        lap_number = _to_int(fields.lap, default=self.lap_number)
+        
         incident_marker = str(match.group("marker")) if match.group("marker") is not None else None
         incident_reason = str(match.group("reason")) if match.group("reason") is not None else None
         incident_lap_number = int(match.group("lap_number")) if match.group("lap_number") is not None else None
 
-        try:
-            incident_driver_numbers = [
-                int(driver_number) for driver_number in re.findall(r"(\d+)", str(match.group("driver_numbers")))
-            ]
-        except:
-            incident_driver_numbers = []
+        incident_driver_numbers = _get_driver_numbers(match.group("driver_numbers"))
         
         # Assume incidents between drivers specify a location and incidents between two or more drivers have driver at fault listed first,
         # since penalties can only be given if one driver is wholly or predominantly at fault?
@@ -647,13 +793,12 @@ class EventsCollection(Collection):
             initiator_driver_number = incident_driver_numbers[0]
             participant_driver_numbers = incident_driver_numbers[1::]
 
-            driver_roles = {
-                **{f"{initiator_driver_number}": "initiator"},
-                **{f"{driver_number}": "participant" for driver_number in participant_driver_numbers}
-            }
+            driver_roles = {_get_driver_key(initiator_driver_number): _ROLE_INITIATOR}
+            for driver_number in participant_driver_numbers:
+                driver_roles[_get_driver_key(driver_number)] = _ROLE_PARTICIPANT
         else:
             # Incident is not between drivers
-            driver_roles = {f"{driver_number}": "initiator" for driver_number in incident_driver_numbers}
+            driver_roles = {_get_driver_key(driver_number): _ROLE_INITIATOR for driver_number in incident_driver_numbers}
 
         # Prioritize lap number in message
         lap_number = incident_lap_number if incident_lap_number is not None else lap_number
@@ -671,33 +816,31 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.DRIVER_ACTION.value,
-            cause=EventCause.INCIDENT.value,
+            category=_CATEGORY_DRIVER_ACTION,
+            cause=_CAUSE_INCIDENT,
             details=details
         )
     
 
     def _process_outs(self, message: Message) -> Iterator[Event]:
         for driver_number, data in message.content.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            # Filter on "IsOut" first since most drivers in a message are not out
+            if not isinstance(data, dict) or not data.get("IsOut"):
                 continue
 
-            if not isinstance(data, dict):
-                continue
-
-            if bool(data.get("IsOut")) is False:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
 
+            location = self.driver_locations.get(driver_number, _NO_DRIVER_DATA)
             details: EventDetails = {
                 "lap_number": self.lap_number,
                 "marker": {
-                    "x": self.driver_locations.get(driver_number, {}).get("x"),
-                    "y": self.driver_locations.get(driver_number, {}).get("y"),
-                    "z": self.driver_locations.get(driver_number, {}).get("z")
+                    "x": location.get("x"),
+                    "y": location.get("y"),
+                    "z": location.get("z")
                 },
-                "driver_roles": {f"{driver_number}": "initiator"}
+                "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR}
             }
 
             yield Event(
@@ -705,41 +848,34 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=message.timepoint,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=message.timepoint),
-                category=EventCategory.DRIVER_ACTION.value,
-                cause=EventCause.OUT.value,
+                category=_CATEGORY_DRIVER_ACTION,
+                cause=_CAUSE_OUT,
                 details=details
             )
         
 
     def _process_overtakes(self, message: Message) -> Iterator[Event]:
         # Overtaking driver has "OvertakeState" equal to 2, overtaken drivers may or may not have "OvertakeState"
-        try:
-            overtaking_driver_number = next(
-                (
-                    int(driver_number)
-                    for driver_number, data in message.content.items()
-                    if isinstance(data, dict) and data.get("OvertakeState") == 2
-                ),
-                None,
-            )
-        except:
-            overtaking_driver_number = None
+        # Classify drivers in a single pass over the message
+        overtaking_driver_number = None
+        overtaken_driver_data = []
+        for driver_number, data in message.content.items():
+            if not isinstance(data, dict):
+                continue
+
+            if data.get("OvertakeState") == 2:
+                if overtaking_driver_number is None:
+                    overtaking_driver_number = _to_int(driver_number)
+            elif data.get("Position") is not None:
+                overtaken_driver_number = _to_int(driver_number)
+                position = _to_int(data.get("Position"))
+                if overtaken_driver_number is not None and position is not None:
+                    overtaken_driver_data.append((overtaken_driver_number, position))
 
         if overtaking_driver_number is None:
             # Not an overtake message
             return
 
-        try:
-            overtaken_driver_data = [
-                (int(driver_number), int(data.get("Position")))
-                for driver_number, data in message.content.items()
-                if isinstance(data, dict)
-                and data.get("OvertakeState") != 2
-                and data.get("Position") is not None
-            ]
-        except:
-            overtaken_driver_data = []
-
         if len(overtaken_driver_data) == 0:
             # Need at least two drivers to have an overtake
             return
@@ -749,16 +885,17 @@ class EventsCollection(Collection):
             overtake_position = position - 1
         
             driver_roles = {
-                **{f"{overtaking_driver_number}": "initiator"},
-                **{f"{overtaken_driver_number}": "participant"}
+                _get_driver_key(overtaking_driver_number): _ROLE_INITIATOR,
+                _get_driver_key(overtaken_driver_number): _ROLE_PARTICIPANT
             }
             
+            location = self.driver_locations.get(overtaking_driver_number, _NO_DRIVER_DATA)
             details: EventDetails = {
                 "lap_number": self.lap_number,
                 "marker": {
-                    "x": self.driver_locations.get(overtaking_driver_number, {}).get("x"),
-                    "y": self.driver_locations.get(overtaking_driver_number, {}).get("y"),
-                    "z": self.driver_locations.get(overtaking_driver_number, {}).get("z")
+                    "x": location.get("x"),
+                    "y": location.get("y"),
+                    "z": location.get("z")
                 },
                 "driver_roles": driver_roles,
                 "position": overtake_position
@@ -774,41 +911,32 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date, 
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_ACTION.value,
-                cause=EventCause.OVERTAKE.value,
+                category=_CATEGORY_DRIVER_ACTION,
+                cause=_CAUSE_OVERTAKE,
                 details=details
             )
 
     
     def _process_personal_best_laps(self, message: Message) -> Iterator[Event]:
-        timing_data = deep_get(obj=message.content, key="Lines")
+        timing_data = message.content.get("Lines")
 
         if not isinstance(timing_data, dict):
             return
         
         for driver_number, data in timing_data.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
 
             if not isinstance(data, dict):
                 continue
             
-            try:
-                best_lap_time = to_timedelta(str(data.get("BestLapTime", {}).get("Value"))).total_seconds()
-            except:
+            best_lap_time = _get_lap_time(data, "BestLapTime")
+            last_lap_time = _get_lap_time(data, "LastLapTime")
+            if best_lap_time is None or last_lap_time is None:
                 continue
 
-            try:
-                last_lap_time = to_timedelta(str(data.get("LastLapTime", {}).get("Value"))).total_seconds()
-            except:
-                continue
-
-            try:
-                position = int(data.get("Position"))
-            except:
-                position = None
+            position = _to_int(data.get("Position"))
 
             # Check for and compare lap times (up to thousandths precision) to ensure recent lap is personal best
             if math.isclose(a=best_lap_time, b=last_lap_time, rel_tol=1e-3):
@@ -816,13 +944,14 @@ class EventsCollection(Collection):
                 # then driver has set a personal best lap resulting in a position change
                 # Otherwise, driver has set a personal best lap, but no change in position (use existing position)
                 position = position if position is not None else self.driver_positions.get(driver_number)
+                stint = self.driver_stints.get(driver_number, _NO_DRIVER_DATA)
 
                 details: EventDetails = {
-                    "driver_roles": {f"{driver_number}": "initiator"},
+                    "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR},
                     "position": position,
                     "lap_duration": best_lap_time,
-                    "compound": self.driver_stints.get(driver_number, {}).get("compound"),
-                    "tyre_age_at_start": self.driver_stints.get(driver_number, {}).get("tyre_age_at_start")
+                    "compound": stint.get("compound"),
+                    "tyre_age_at_start": stint.get("tyre_age_at_start")
                 }
 
                 yield Event(
@@ -830,8 +959,8 @@ class EventsCollection(Collection):
                     session_key=self.session_key,
                     date=message.timepoint,
                     elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=message.timepoint),
-                    category=EventCategory.DRIVER_ACTION.value,
-                    cause=EventCause.PERSONAL_BEST_LAP.value,
+                    category=_CATEGORY_DRIVER_ACTION,
+                    cause=_CAUSE_PERSONAL_BEST_LAP,
                     details=details
                 )
     
@@ -839,46 +968,47 @@ class EventsCollection(Collection):
     def _process_pits(self, message: Message) -> Iterator[Event]:
         # Use stint information to determine if a pit has occurred since pit information arrives before corresponding stint information
         # driver_pits should already be updated at this point
-        stints = deep_get(obj=message.content, key="Lines")
+        stints = message.content.get("Lines")
         
         if not isinstance(stints, dict):
             return
         
         for driver_number, data in stints.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             if not isinstance(data, dict):
                 continue
 
-            driver_stints = deep_get(obj=data, key="Stints")
+            driver_stints = data.get("Stints")
 
-            if not isinstance(driver_stints, dict) or len(driver_stints.keys()) == 0:
+            if not isinstance(driver_stints, dict) or not driver_stints:
                 continue
             
-            latest_stint_number = max(driver_stints.keys(), key=lambda stint_number: int(stint_number))
-            latest_stint_data = driver_stints.get(latest_stint_number)
+            latest_stint_data = _get_latest_stint(driver_stints)
 
             if not isinstance(latest_stint_data, dict):
                 continue
         
-            if not "Compound" in latest_stint_data or latest_stint_data.get("Compound") == "UNKNOWN" or latest_stint_data.get("TyresNotChanged") != "0":
+            if latest_stint_data.get("Compound") in (None, "UNKNOWN") or latest_stint_data.get("TyresNotChanged") != "0":
                 continue
             
+            pit = self.driver_pits.get(driver_number, _NO_DRIVER_DATA)
+            stint = self.driver_stints.get(driver_number, _NO_DRIVER_DATA)
+
             # Prioritize date from pit information
-            date = self.driver_pits.get(driver_number, {}).get("date") if self.driver_pits.get(driver_number, {}).get("date") is not None else message.timepoint
-            lap_number = self.driver_pits.get(driver_number, {}).get("lap_number") if self.driver_pits.get(driver_number, {}).get("lap_number") is not None else self.lap_number
+            date = pit.get("date") if pit.get("date") is not None else message.timepoint
+            lap_number = pit.get("lap_number") if pit.get("lap_number") is not None else self.lap_number
             # Include pit stop duration only if not stale
-            pit_stop_duration = self.driver_pits.get(driver_number, {}).get("pit_stop_duration") if not self.driver_pits.get(driver_number, {}).get("pit_stop_duration_is_stale") else None
+            pit_stop_duration = pit.get("pit_stop_duration") if not pit.get("pit_stop_duration_is_stale") else None
 
             details: EventDetails = {
                 "lap_number": lap_number,
-                "driver_roles": {f"{driver_number}": "initiator"},
-                "compound": self.driver_stints.get(driver_number, {}).get("compound"),
-                "tyre_age_at_start": self.driver_stints.get(driver_number, {}).get("tyre_age_at_start"),
-                "pit_lane_duration": self.driver_pits.get(driver_number, {}).get("pit_lane_duration"),
+                "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR},
+                "compound": stint.get("compound"),
+                "tyre_age_at_start": stint.get("tyre_age_at_start"),
+                "pit_lane_duration": pit.get("pit_lane_duration"),
                 "pit_stop_duration": pit_stop_duration
             }
 
@@ -887,43 +1017,30 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_ACTION.value,
-                cause=EventCause.PIT.value,
+                category=_CATEGORY_DRIVER_ACTION,
+                cause=_CAUSE_PIT,
                 details=details
             )
 
     
-    def _process_track_limits(self, message: Message) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_track_limits(self, message: Message, fields: _RaceControlFields) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
         
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
-            date = message.timepoint
-
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
-        
-        # Extract track limits violation information from race control message
-        track_limits_pattern = (
-            r"^"
-            r"CAR\s+(?P<driver_number>\d+).*?"      # Captures driver number
-            r"AT\s+(?P<marker>[A-Z0-9/\s]+)\s+"     # Captures marker
-            r"LAP\s+(?P<lap_number>\d+)\s+"         # Captures lap number
-            r"(?P<time>\b\d{1,2}:\d{2}:\d{2}\b).*"  # Captures local time
-            r"$"
-        )
-        match = re.search(pattern=track_limits_pattern, string=race_control_message)
+        # Extract track limits violation information from race control message, before anything else is parsed
+        match = _TRACK_LIMITS_PATTERN.search(race_control_message)
         
         if match is None:
             return
         
+        date = _parse_utc(fields.utc)
+        if date is None:
+            date = message.timepoint
+
+        lap_number = _to_int(fields.lap, default=self.lap_number)
+        
         track_limits_driver_number = int(match.group("driver_number")) if match.group("driver_number") is not None else None
         track_limits_marker = str(match.group("marker")) if match.group("marker") is not None else None
         track_limits_lap_number = int(match.group("lap_number")) if match.group("lap_number") is not None else None
@@ -931,12 +1048,12 @@ class EventsCollection(Collection):
 
         try:
             # Track limits violation time is local, need to convert to UTC
-            track_limits_date = datetime.combine(
-                date=date.date(),
-                time=datetime.strptime(track_limits_time, "%H:%M:%S").time()
-            )
+            # Pattern guarantees H:MM:SS or HH:MM:SS, so split instead of using strptime
+            hours, minutes, seconds = map(int, track_limits_time.split(":"))
+            track_limits_date = datetime(date.year, date.month, date.day, hours, minutes, seconds)
             track_limits_date = add_timezone_info(dt=track_limits_date, gmt_offset=self.session_offset)
-        except:
+        except (AttributeError, ValueError):
+            # Session offset not yet known or time out of range
             track_limits_date = None
 
         # Prioritize information in message
@@ -946,7 +1063,7 @@ class EventsCollection(Collection):
         details: EventDetails = {
             "lap_number": lap_number,
             "marker": track_limits_marker,
-            "driver_roles": {f"{track_limits_driver_number}": "initiator"} if track_limits_driver_number is not None else None,
+            "driver_roles": {_get_driver_key(track_limits_driver_number): _ROLE_INITIATOR} if track_limits_driver_number is not None else None,
             "message": race_control_message
         }
 
@@ -955,56 +1072,36 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.DRIVER_ACTION.value,
-            cause=EventCause.TRACK_LIMITS.value,
+            category=_CATEGORY_DRIVER_ACTION,
+            cause=_CAUSE_TRACK_LIMITS,
             details=details
         )
 
 
-    def _process_incident_verdict(self, message: Message) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_incident_verdict(self, message: Message, fields: _RaceControlFields) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
         
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
-            date = message.timepoint
-
-        # Lap number should be the current lap number since verdict is separate from incident
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
-        
-        # Extract incident verdict information from race control message
-        # We need two patterns as penalty verdicts differ from others in structure
-        incident_verdict_pattern = (
-            r"^"
-            r"(?:FIA\s+STEWARDS:\s+)?"
-            r"(?:(?P<marker>[A-Z0-9/\s]+?)\s+)?"                                                        # Captures marker if it exists
-            r"INCIDENT"
-            r"(?:\s+INVOLVING\s+CARS?\s+(?P<driver_numbers>(?:\d+\s+\(\w+\)(?:\s*,\s*|\s+AND\s+)?)+))?" # Captures driver numbers if they exist
-            r"\s+"
-            r"(?P<verdict>[^-]+?)"                                                                      # Captures verdict
-            r"(?:\s*-\s*(?P<reason>.+))?"                                                               # Captures reason if it exists
-            r"$"
+        # Extract incident verdict information from race control message, only trying the penalty pattern if the standard one fails
+        # Both patterns require a literal keyword, check for it first so that non-matching messages are rejected without backtracking
+        incident_verdict_match = _INCIDENT_VERDICT_PATTERN.search(race_control_message) if "INCIDENT" in race_control_message else None
+        penalty_verdict_match = (
+            _PENALTY_VERDICT_PATTERN.search(race_control_message)
+            if incident_verdict_match is None and "CAR" in race_control_message
+            else None
         )
 
-        penalty_verdict_pattern = (
-            r"^"
-            r"(?:FIA\s+STEWARDS:\s+)?"
-            r"(?P<verdict>.+?)"                                                                         # Captures verdict
-            r"\s+FOR\s+CAR\s+"
-            r"(?P<driver_number>\d+)\s+\(\w+\)"                                                         # Captures driver number
-            r"(?:\s*-\s*(?P<reason>.+))?"                                                               # Captures reason if it exists
-            r"$"
-        )
+        if incident_verdict_match is None and penalty_verdict_match is None:
+            return
 
-        incident_verdict_match = re.search(pattern=incident_verdict_pattern, string=race_control_message)
-        penalty_verdict_match = re.search(pattern=penalty_verdict_pattern, string=race_control_message)
+        date = _parse_utc(fields.utc)
+        if date is None:
+            date = message.timepoint
+
+        # Lap number should be the current lap number since verdict is separate from incident
+        lap_number = _to_int(fields.lap, default=self.lap_number)
 
         if incident_verdict_match is not None:
             # Standard incident verdict message
@@ -1012,12 +1109,7 @@ class EventsCollection(Collection):
             incident_verdict = str(incident_verdict_match.group("verdict")) if incident_verdict_match.group("verdict") is not None else None
             incident_verdict_reason = str(incident_verdict_match.group("reason")) if incident_verdict_match.group("reason") is not None else None
             
-            try:
-                incident_verdict_driver_numbers = [
-                    int(driver_number) for driver_number in re.findall(r"(\d+)", str(incident_verdict_match.group("driver_numbers")))
-                ]
-            except:
-                incident_verdict_driver_numbers = []
+            incident_verdict_driver_numbers = _get_driver_numbers(incident_verdict_match.group("driver_numbers"))
             
             if len(incident_verdict_driver_numbers) == 0:
                 # Incident does not specify drivers
@@ -1027,13 +1119,12 @@ class EventsCollection(Collection):
                 initiator_driver_number = incident_verdict_driver_numbers[0]
                 participant_driver_numbers = incident_verdict_driver_numbers[1::]
 
-                driver_roles = {
-                    **{f"{initiator_driver_number}": "initiator"},
-                    **{f"{driver_number}": "participant" for driver_number in participant_driver_numbers}
-                }
+                driver_roles = {_get_driver_key(initiator_driver_number): _ROLE_INITIATOR}
+                for driver_number in participant_driver_numbers:
+                    driver_roles[_get_driver_key(driver_number)] = _ROLE_PARTICIPANT
             else:
                 # Incident is not between drivers
-                driver_roles = {f"{driver_number}": "initiator" for driver_number in incident_verdict_driver_numbers}
+                driver_roles = {_get_driver_key(driver_number): _ROLE_INITIATOR for driver_number in incident_verdict_driver_numbers}
 
             details: EventDetails = {
                 "lap_number": lap_number,
@@ -1049,8 +1140,8 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_NOTIFICATION.value,
-                cause=EventCause.INCIDENT_VERDICT.value,
+                category=_CATEGORY_DRIVER_NOTIFICATION,
+                cause=_CAUSE_INCIDENT_VERDICT,
                 details=details
             )
             
@@ -1061,7 +1152,7 @@ class EventsCollection(Collection):
             
             details: EventDetails = {
                 "lap_number": lap_number,
-                "driver_roles": {f"{penalty_verdict_driver_number}": "initiator"} if penalty_verdict_driver_number is not None else None,
+                "driver_roles": {_get_driver_key(penalty_verdict_driver_number): _ROLE_INITIATOR} if penalty_verdict_driver_number is not None else None,
                 "verdict": penalty_verdict,
                 "reason": penalty_verdict_reason,
                 "message": race_control_message
@@ -1072,8 +1163,8 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_NOTIFICATION.value,
-                cause=EventCause.INCIDENT_VERDICT.value,
+                category=_CATEGORY_DRIVER_NOTIFICATION,
+                cause=_CAUSE_INCIDENT_VERDICT,
                 details=details
             )
 
@@ -1082,12 +1173,13 @@ class EventsCollection(Collection):
         # Create provisional classification events for all drivers just before session end
         # Include personal best lap time for qualifying sessions only
         for driver_number, position in self.driver_positions.items():
+            stint = self.driver_stints.get(driver_number, _NO_DRIVER_DATA)
             details: EventDetails = {
-                "driver_roles": {f"{driver_number}": "initiator"},
+                "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR},
                 "position": position,
                 "lap_duration": self.driver_personal_best_laps.get(driver_number) if self.session_type in ("Practice", "Qualifying") else None,
-                "compound": self.driver_stints.get(driver_number, {}).get("compound") if self.session_type in ("Practice", "Qualifying") else None,
-                "tyre_age_at_start": self.driver_stints.get(driver_number, {}).get("tyre_age_at_start") if self.session_type in ("Practice", "Qualifying") else None
+                "compound": stint.get("compound") if self.session_type in ("Practice", "Qualifying") else None,
+                "tyre_age_at_start": stint.get("tyre_age_at_start") if self.session_type in ("Practice", "Qualifying") else None
             }
 
             # Adjust date so that higher positions are before lower positions when sorting chronologically by date
@@ -1099,8 +1191,8 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_NOTIFICATION.value,
-                cause=EventCause.PROVISIONAL_CLASSIFICATION.value,
+                category=_CATEGORY_DRIVER_NOTIFICATION,
+                cause=_CAUSE_PROVISIONAL_CLASSIFICATION,
                 details=details
             )
 
@@ -1110,37 +1202,34 @@ class EventsCollection(Collection):
     
     def _process_qualifying_stage_classifications(self, message: Message) -> Iterator[Event]:
         # Determine whether drivers were eliminated or advanced from the previous qualifying stage
-        try:
-            current_qualifying_stage_number = int(deep_get(obj=message.content, key="SessionPart"))
-        except:
-            return
+        current_qualifying_stage_number = _to_int(message.content.get("SessionPart"))
         
         if current_qualifying_stage_number not in (2, 3):
             return
         
-        driver_status_data = deep_get(obj=message.content, key="Lines")
+        driver_status_data = message.content.get("Lines")
 
         if not isinstance(driver_status_data, dict):
             return
         
         for driver_number, data in driver_status_data.items():
-            try:
-                driver_number = int(driver_number)
-            except:
+            driver_number = _to_int(driver_number)
+            if driver_number is None:
                 continue
             
             if not isinstance(data, dict):
                 continue
 
-            eliminated = bool(data.get("KnockedOut")) or False
+            eliminated = bool(data.get("KnockedOut"))
             position = self.driver_positions.get(driver_number)
+            stint = self.driver_stints.get(driver_number, _NO_DRIVER_DATA)
 
             details: EventDetails = {
-                "driver_roles": {f"{driver_number}": "initiator"},
+                "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR},
                 "position": position,
                 "lap_duration": self.driver_personal_best_laps.get(driver_number),
-                "compound": self.driver_stints.get(driver_number, {}).get("compound"),
-                "tyre_age_at_start": self.driver_stints.get(driver_number, {}).get("tyre_age_at_start"),
+                "compound": stint.get("compound"),
+                "tyre_age_at_start": stint.get("tyre_age_at_start"),
                 # Advanced/eliminated from the previous stage
                 "qualifying_stage_number": current_qualifying_stage_number - 1,
                 "eliminated": eliminated
@@ -1155,43 +1244,34 @@ class EventsCollection(Collection):
                 session_key=self.session_key,
                 date=date,
                 elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-                category=EventCategory.DRIVER_NOTIFICATION.value,
-                cause=EventCause.QUALIFYING_STAGE_CLASSIFICATION.value,
+                category=_CATEGORY_DRIVER_NOTIFICATION,
+                cause=_CAUSE_QUALIFYING_STAGE_CLASSIFICATION,
                 details=details
             )
 
 
-    def _process_driver_flag(self, message: Message, event_cause: EventCause) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_driver_flag(self, message: Message, fields: _RaceControlFields, event_cause: EventCause) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
         
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
+        date = _parse_utc(fields.utc)
+        if date is None:
             date = message.timepoint
 
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
+        lap_number = _to_int(fields.lap, default=self.lap_number)
 
-        try:
-            driver_number = int(deep_get(obj=message.content, key="RacingNumber"))
-        except:
-            driver_number = None
+        driver_number = _to_int(fields.racing_number)
         
         # Black flags do not have "RacingNumber" field, need to extract driver number from race control message
         if driver_number is None and race_control_message is not None:
-            driver_flag_pattern = r"CAR (?P<driver_number>\d+)"
-            match = re.search(pattern=driver_flag_pattern, string=race_control_message)
-            driver_number = int(match.group("driver_number")) if match.group("driver_number") is not None else None
+            match = _DRIVER_FLAG_PATTERN.search(race_control_message)
+            driver_number = int(match.group("driver_number")) if match is not None else None
 
         details: EventDetails = {
             "lap_number": lap_number,
-            "driver_roles": {f"{driver_number}": "initiator"} if driver_number is not None else None,
+            "driver_roles": {_get_driver_key(driver_number): _ROLE_INITIATOR} if driver_number is not None else None,
             "message": race_control_message
         }
 
@@ -1200,33 +1280,27 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.DRIVER_NOTIFICATION.value,
+            category=_CATEGORY_DRIVER_NOTIFICATION,
             cause=event_cause.value,
             details=details
         )
     
 
-    def _process_sector_flag(self, message: Message, event_cause: EventCause) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_sector_flag(self, message: Message, fields: _RaceControlFields, event_cause: EventCause) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
 
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
+        date = _parse_utc(fields.utc)
+        if date is None:
             date = message.timepoint
 
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
+        lap_number = _to_int(fields.lap, default=self.lap_number)
         
         # Extract sector from race control message
-        sector_pattern = r"(?P<marker>SECTOR\s+\d+)"
-        match = re.search(pattern=sector_pattern, string=race_control_message)
-        sector_marker = str(match.group("marker")) if match.group("marker") is not None else None
+        match = _SECTOR_PATTERN.search(race_control_message)
+        sector_marker = str(match.group("marker")) if match is not None else None
         
         details: EventDetails = {
             "lap_number": lap_number,
@@ -1239,28 +1313,23 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.SECTOR_NOTIFICATION.value,
+            category=_CATEGORY_SECTOR_NOTIFICATION,
             cause=event_cause.value,
             details=details
         )
     
 
-    def _process_track_flag(self, message: Message, event_cause: EventCause) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_track_flag(self, message: Message, fields: _RaceControlFields, event_cause: EventCause) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
 
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
+        date = _parse_utc(fields.utc)
+        if date is None:
             date = message.timepoint
 
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
+        lap_number = _to_int(fields.lap, default=self.lap_number)
         
         details: EventDetails = {
             "lap_number": lap_number,
@@ -1272,7 +1341,7 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.TRACK_NOTIFICATION.value,
+            category=_CATEGORY_TRACK_NOTIFICATION,
             cause=event_cause.value,
             details=details
         )
@@ -1284,7 +1353,7 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=message.timepoint,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=message.timepoint),
-            category=EventCategory.SESSION_NOTIFICATION.value,
+            category=_CATEGORY_SESSION_NOTIFICATION,
             cause=event_cause.value,
             details=None
         )
@@ -1293,22 +1362,17 @@ class EventsCollection(Collection):
         self._update_session_status(message)
 
 
-    def _process_race_control_message(self, message: Message) -> Iterator[Event]:
-        race_control_message = deep_get(obj=message.content, key="Message")
+    def _process_race_control_message(self, message: Message, fields: _RaceControlFields) -> Iterator[Event]:
+        race_control_message = fields.message
 
         if not isinstance(race_control_message, str):
             return
         
-        try:
-            date = to_datetime(deep_get(obj=message.content, key="Utc"))
-            date = pytz.utc.localize(date)
-        except:
+        date = _parse_utc(fields.utc)
+        if date is None:
             date = message.timepoint
 
-        try:
-            lap_number = int(deep_get(obj=message.content, key="Lap"))
-        except:
-            lap_number = self.lap_number
+        lap_number = _to_int(fields.lap, default=self.lap_number)
 
         details: EventDetails = {
             "lap_number": lap_number,
@@ -1320,348 +1384,263 @@ class EventsCollection(Collection):
             session_key=self.session_key,
             date=date,
             elapsed_time=_get_elapsed_time(start=self.session_stream_start, end=date),
-            category=EventCategory.OTHER.value,
-            cause=EventCause.RACE_CONTROL_MESSAGE.value,
+            category=_CATEGORY_OTHER,
+            cause=_CAUSE_RACE_CONTROL_MESSAGE,
             details=details
         )
 
 
-    # Maps event causes to unique conditions that determine if event messages belong to that cause
+    def _classify_race_control_message(self, fields: _RaceControlFields) -> EventCause | None:
+        # Fields are checked in priority order
+        race_control_message = fields.message
+        flag = fields.flag
+
+        has_message = isinstance(race_control_message, str)
+        # Ignore flag messages before and after the actual session
+        in_session = self.session_status in ("Aborted", "Started")
+
+        if has_message and "INCIDENT" in race_control_message and "NOTED" in race_control_message:
+            return EventCause.INCIDENT
+        if has_message and "TRACK LIMITS" in race_control_message:
+            return EventCause.TRACK_LIMITS
+        
+        # Black flags do not have a "Flag" field
+        # Black and orange/black and white flags must be checked before black flags since they also contain "BLACK"
+        if in_session and has_message and "BLACK" in race_control_message:
+            if "BLACK AND ORANGE" in race_control_message:
+                return EventCause.BLACK_AND_ORANGE_FLAG
+            if "BLACK AND WHITE" in race_control_message:
+                return EventCause.BLACK_AND_WHITE_FLAG
+            return EventCause.BLACK_FLAG
+        if in_session and flag == "BLUE":
+            return EventCause.BLUE_FLAG
+        
+        # Handle edge cases
+        if (
+            has_message
+            and "FIA STEWARDS" in race_control_message
+            and "UNDER INVESTIGATION" not in race_control_message
+            and "PENALTY SERVED" not in race_control_message
+        ):
+            return EventCause.INCIDENT_VERDICT
+
+        if in_session and flag in ("GREEN", "CLEAR"):
+            return EventCause.GREEN_FLAG
+        if in_session and flag == "YELLOW":
+            return EventCause.YELLOW_FLAG
+        if in_session and flag == "DOUBLE YELLOW":
+            return EventCause.DOUBLE_YELLOW_FLAG
+        
+        if flag == "CHEQUERED":
+            return EventCause.CHEQUERED_FLAG
+        if flag == "RED":
+            return EventCause.RED_FLAG
+        
+        if self.session_type == "Race" and fields.category == "SafetyCar":
+            safety_car_cause = _SAFETY_CAR_CAUSES.get((fields.mode, fields.status))
+            if safety_car_cause is not None:
+                return safety_car_cause
+
+        # Must be last since other events satisfy this condition
+        # Ignore messages before and after the actual session
+        # "Under investigation" redundant because of incident messages
+        if in_session and has_message and "UNDER INVESTIGATION" not in race_control_message:
+            return EventCause.RACE_CONTROL_MESSAGE
+
+        return None
+
+
+    def _is_session_stream_start(self, message: Message) -> bool:
+        # First session status message always has empty series list
+        series = message.content.get("Series")
+        return self.session_status is None and isinstance(series, list) and len(series) == 0
+
+
+    def _classify_session_data_message(self, message: Message) -> EventCause | None:
+        # Session status is read once and checked in priority order
+        session_status = deep_get(obj=message.content, key="SessionStatus")
+        previous_session_status = self.session_status
+
+        if previous_session_status is not None and session_status == "Finalised":
+            return EventCause.PROVISIONAL_CLASSIFICATION
+        if self._is_session_stream_start(message):
+            return EventCause.SESSION_START
+        if previous_session_status is not None and session_status == "Ends":
+            return EventCause.SESSION_END
+        if previous_session_status is not None and session_status == "Aborted":
+            return EventCause.SESSION_STOP
+        if previous_session_status == "Aborted" and session_status == "Started":
+            return EventCause.SESSION_RESUME
+
+        match self.session_type:
+            case "Practice":
+                if previous_session_status is None and session_status == "Started":
+                    return EventCause.PRACTICE_START
+                if previous_session_status is not None and session_status == "Finished":
+                    return EventCause.PRACTICE_END
+            case "Qualifying":
+                # Later qualifying stages start after the previous stage has finished
+                if session_status == "Started":
+                    if self.qualifying_stage_number == 1 and previous_session_status is None:
+                        return EventCause.Q1_START
+                    if self.qualifying_stage_number == 2 and previous_session_status == "Finished":
+                        return EventCause.Q2_START
+                    if self.qualifying_stage_number == 3 and previous_session_status == "Finished":
+                        return EventCause.Q3_START
+                if session_status == "Finished" and previous_session_status is not None:
+                    if self.qualifying_stage_number == 1:
+                        return EventCause.Q1_END
+                    if self.qualifying_stage_number == 2:
+                        return EventCause.Q2_END
+                    if self.qualifying_stage_number == 3:
+                        return EventCause.Q3_END
+            case "Race":
+                if previous_session_status is None and session_status == "Started":
+                    return EventCause.RACE_START
+                if previous_session_status is not None and session_status == "Finished":
+                    return EventCause.RACE_END
+
+        return None
+
+
+    # Maps message topics to event causes and their unique conditions that determine if event messages belong to that cause
+    # Causes are checked in order within a topic
+    # Race control and session data messages are classified separately by _classify_race_control_message and _classify_session_data_message
     # message should be of type Message
-    def _get_event_condition_map(self) -> dict[EventCause, Callable[..., bool]]:
+    def _get_event_condition_map(self) -> dict[str, dict[EventCause, Callable[..., bool]]]:
         return {
-            EventCause.INCIDENT: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "INCIDENT" in deep_get(obj=message.content, key="Message"),
-                lambda: "NOTED" in deep_get(obj=message.content, key="Message")
-            ]),
-            EventCause.OUT: lambda message: all(cond() for cond in [
-                lambda: message.topic == "DriverRaceInfo",
-                lambda: self.session_type == "Race",
-                lambda: bool(deep_get(obj=message.content, key="IsOut")) is True
-            ]),
-            EventCause.OVERTAKE: lambda message: all(cond() for cond in [
-                lambda: message.topic == "DriverRaceInfo",
-                lambda: self.session_type == "Race",
-                # Overtakes after the session has finished are likely penalties and should not be counted
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: deep_get(obj=message.content, key="OvertakeState") is not None,
-                lambda: deep_get(obj=message.content, key="Position") is not None
-            ]),
-            EventCause.PERSONAL_BEST_LAP: lambda message: all(cond() for cond in [
-                lambda: message.topic == "TimingData", 
-                lambda: self.session_type in ("Practice", "Qualifying"),
-                lambda: deep_get(obj=message.content, key="SessionPart") is None
-            ]),
-            EventCause.PIT: lambda message: all(cond() for cond in [
-                lambda: message.topic == "TimingAppData",
-                lambda: self.session_type == "Race",
-                # Pit stops before the session has started should not be counted including pit stops on formation lap\
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: isinstance(deep_get(obj=message.content, key="Compound"), str)
-            ]),
-            EventCause.TRACK_LIMITS: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "TRACK LIMITS" in deep_get(obj=message.content, key="Message")
-            ]),
-
-            # Ignore flag messages before and after the actual session
-            EventCause.BLACK_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                # Check that message is a str to avoid TypeError when searching for substring
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "BLACK" in deep_get(obj=message.content, key="Message")
-            ]), # Black flags do not have a "Flag" field
-            EventCause.BLACK_AND_ORANGE_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "BLACK AND ORANGE" in deep_get(obj=message.content, key="Message")
-            ]),
-            EventCause.BLACK_AND_WHITE_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "BLACK AND WHITE" in deep_get(obj=message.content, key="Message")
-            ]),
-            EventCause.BLUE_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: deep_get(obj=message.content, key="Flag") == "BLUE"
-            ]),
-            EventCause.INCIDENT_VERDICT: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                lambda: "FIA STEWARDS" in deep_get(obj=message.content, key="Message"),
-                # Handle edge cases
-                lambda: "UNDER INVESTIGATION" not in deep_get(obj=message.content, key="Message"),
-                lambda: "PENALTY SERVED" not in deep_get(obj=message.content, key="Message")
-            ]),
-            EventCause.PROVISIONAL_CLASSIFICATION: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_status is not None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finalised"
-            ]),
-            EventCause.QUALIFYING_STAGE_CLASSIFICATION: lambda message: all(cond() for cond in [
-                lambda: message.topic == "TimingData", 
-                lambda: self.session_type == "Qualifying",
-                # We only know the results of the previous stage after the next stage begins
-                lambda: deep_get(obj=message.content, key="SessionPart") in (2, 3)
-            ]),
-
-            # Ignore flag messages before and after the actual session
-            EventCause.GREEN_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started")
-            ]) and any(cond() for cond in [
-                lambda: deep_get(obj=message.content, key="Flag") == "GREEN",
-                lambda: deep_get(obj=message.content, key="Flag") == "CLEAR",
-            ]),
-            EventCause.YELLOW_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: deep_get(obj=message.content, key="Flag") == "YELLOW"
-            ]),
-            EventCause.DOUBLE_YELLOW_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: deep_get(obj=message.content, key="Flag") == "DOUBLE YELLOW"
-            ]),
-            
-            EventCause.CHEQUERED_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: deep_get(obj=message.content, key="Flag") == "CHEQUERED"
-            ]),
-            EventCause.RED_FLAG: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: deep_get(obj=message.content, key="Flag") == "RED"
-            ]),
-            EventCause.SAFETY_CAR_DEPLOYED: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_type == "Race",
-                lambda: deep_get(obj=message.content, key="Category") == "SafetyCar",
-                lambda: deep_get(obj=message.content, key="Mode") == "SAFETY CAR",
-                lambda: deep_get(obj=message.content, key="Status") == "DEPLOYED"
-            ]),
-            EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_type == "Race",
-                lambda: deep_get(obj=message.content, key="Category") == "SafetyCar",
-                lambda: deep_get(obj=message.content, key="Mode") == "VIRTUAL SAFETY CAR",
-                lambda: deep_get(obj=message.content, key="Status") == "DEPLOYED"
-            ]),
-            EventCause.SAFETY_CAR_ENDING: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_type == "Race",
-                lambda: deep_get(obj=message.content, key="Category") == "SafetyCar",
-                lambda: deep_get(obj=message.content, key="Mode") == "SAFETY CAR",
-                lambda: deep_get(obj=message.content, key="Status") == "IN THIS LAP"
-            ]),
-            EventCause.VIRTUAL_SAFETY_CAR_ENDING: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_type == "Race",
-                lambda: deep_get(obj=message.content, key="Category") == "SafetyCar",
-                lambda: deep_get(obj=message.content, key="Mode") == "VIRTUAL SAFETY CAR",
-                lambda: deep_get(obj=message.content, key="Status") == "ENDING"
-            ]),
-
-            EventCause.SESSION_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_status is None,
-                # First session status message always has empty series list
-                lambda: isinstance(deep_get(obj=message.content, key="Series"), list),
-                lambda: len(deep_get(obj=message.content, key="Series")) == 0
-            ]),
-            EventCause.SESSION_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_status is not None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Ends"
-            ]),
-            EventCause.SESSION_STOP: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_status is not None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Aborted"
-            ]),
-            EventCause.SESSION_RESUME: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_status == "Aborted", # Prev session status
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.PRACTICE_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Practice",
-                lambda: self.session_status is None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.PRACTICE_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Practice",
-                lambda: self.session_status is not None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finished"
-            ]),
-            EventCause.Q1_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status is None,
-                lambda: self.qualifying_stage_number == 1,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.Q1_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status is not None,
-                lambda: self.qualifying_stage_number == 1,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finished"
-            ]),
-            EventCause.Q2_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status == "Finished", # Prev session status
-                lambda: self.qualifying_stage_number == 2,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.Q2_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status is not None,
-                lambda: self.qualifying_stage_number == 2,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finished"
-            ]),
-            EventCause.Q3_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status == "Finished", # Prev session status
-                lambda: self.qualifying_stage_number == 3,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.Q3_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Qualifying",
-                lambda: self.session_status is not None,
-                lambda: self.qualifying_stage_number == 3,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finished"
-            ]),
-            EventCause.RACE_START: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Race",
-                lambda: self.session_status is None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Started"
-            ]),
-            EventCause.RACE_END: lambda message: all(cond() for cond in [
-                lambda: message.topic == "SessionData",
-                lambda: self.session_type == "Race",
-                lambda: self.session_status is not None,
-                lambda: deep_get(obj=message.content, key="SessionStatus") == "Finished"
-            ]),
-
-            # Must be last since other events satisfy this condition
-            # Ignore messages before and after the actual session
-            EventCause.RACE_CONTROL_MESSAGE: lambda message: all(cond() for cond in [
-                lambda: message.topic == "RaceControlMessages",
-                lambda: self.session_status in ("Aborted", "Started"),
-                lambda: isinstance(deep_get(obj=message.content, key="Message"), str),
-                # "Under investigation" redundant because of incident messages
-                lambda: "UNDER INVESTIGATION" not in deep_get(obj=message.content, key="Message"),
-            ])
+            "DriverRaceInfo": {
+                EventCause.OUT: lambda message: bool(
+                    self.session_type == "Race"
+                    and deep_get(obj=message.content, key="IsOut")
+                ),
+                EventCause.OVERTAKE: lambda message: (
+                    self.session_type == "Race"
+                    # Overtakes after the session has finished are likely penalties and should not be counted
+                    and self.session_status in ("Aborted", "Started")
+                    and deep_get(obj=message.content, key="OvertakeState") is not None
+                    and deep_get(obj=message.content, key="Position") is not None
+                )
+            },
+            "TimingData": {
+                EventCause.PERSONAL_BEST_LAP: lambda message: (
+                    self.session_type in ("Practice", "Qualifying")
+                    and message.content.get("SessionPart") is None
+                ),
+                EventCause.QUALIFYING_STAGE_CLASSIFICATION: lambda message: (
+                    self.session_type == "Qualifying"
+                    # We only know the results of the previous stage after the next stage begins
+                    and message.content.get("SessionPart") in (2, 3)
+                )
+            },
+            "TimingAppData": {
+                EventCause.PIT: lambda message: (
+                    self.session_type == "Race"
+                    # Pit stops before the session has started should not be counted including pit stops on formation lap
+                    and self.session_status in ("Aborted", "Started")
+                    and isinstance(deep_get(obj=message.content, key="Compound"), str)
+                )
+            }
         }
 
     
+    def _process_green_flag(self, message: Message, fields: _RaceControlFields) -> Iterator[Event]:
+        # Green flags can either clear a sector or the whole track
+        if fields.scope == "Sector":
+            return self._process_sector_flag(message=message, fields=fields, event_cause=EventCause.GREEN_FLAG)
+        return self._process_track_flag(message=message, fields=fields, event_cause=EventCause.GREEN_FLAG)
+
+
     # Maps event causes to specific processing logic
+    # Race control processors also receive the fields of the race control message
     # message should be of type Message
     def _get_event_processing_map(self) -> dict[EventCause, Callable[..., Iterator[Event]]]:
         return {
-            EventCause.INCIDENT: lambda message: self._process_incident(message),
-            EventCause.OUT: lambda message: self._process_outs(message),
-            EventCause.OVERTAKE: lambda message: self._process_overtakes(message),
-            EventCause.PERSONAL_BEST_LAP: lambda message: self._process_personal_best_laps(message),
-            EventCause.PIT: lambda message: self._process_pits(message),
-            EventCause.TRACK_LIMITS: lambda message: self._process_track_limits(message),
+            EventCause.INCIDENT: self._process_incident,
+            EventCause.OUT: self._process_outs,
+            EventCause.OVERTAKE: self._process_overtakes,
+            EventCause.PERSONAL_BEST_LAP: self._process_personal_best_laps,
+            EventCause.PIT: self._process_pits,
+            EventCause.TRACK_LIMITS: self._process_track_limits,
             
-            EventCause.BLACK_FLAG: lambda message: self._process_driver_flag(message=message, event_cause=EventCause.BLACK_FLAG),
-            EventCause.BLACK_AND_ORANGE_FLAG: lambda message: self._process_driver_flag(message=message, event_cause=EventCause.BLACK_AND_ORANGE_FLAG),
-            EventCause.BLACK_AND_WHITE_FLAG: lambda message: self._process_driver_flag(message=message, event_cause=EventCause.BLACK_AND_WHITE_FLAG),
-            EventCause.BLUE_FLAG: lambda message: self._process_driver_flag(message=message, event_cause=EventCause.BLUE_FLAG),
-            EventCause.INCIDENT_VERDICT: lambda message: self._process_incident_verdict(message),
-            EventCause.PROVISIONAL_CLASSIFICATION: lambda message: self._process_provisional_classification(message),
-            EventCause.QUALIFYING_STAGE_CLASSIFICATION: lambda message: self._process_qualifying_stage_classifications(message),
-
-            EventCause.GREEN_FLAG: (
-                lambda message: self._process_sector_flag(message=message, event_cause=EventCause.GREEN_FLAG) 
-                if deep_get(obj=message.content, key="Scope") is not None and deep_get(obj=message.content, key="Scope") == "Sector"
-                else self._process_track_flag(message=message, event_cause=EventCause.GREEN_FLAG)
-            ),
-            EventCause.YELLOW_FLAG: lambda message: self._process_sector_flag(message=message, event_cause=EventCause.YELLOW_FLAG),
-            EventCause.DOUBLE_YELLOW_FLAG: lambda message: self._process_sector_flag(message=message, event_cause=EventCause.DOUBLE_YELLOW_FLAG),
-
-            EventCause.CHEQUERED_FLAG: lambda message: self._process_track_flag(message=message, event_cause=EventCause.CHEQUERED_FLAG),
-            EventCause.RED_FLAG: lambda message: self._process_track_flag(message=message, event_cause=EventCause.RED_FLAG),
-            EventCause.SAFETY_CAR_DEPLOYED: lambda message: self._process_track_flag(message=message, event_cause=EventCause.SAFETY_CAR_DEPLOYED),
-            EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED: lambda message: self._process_track_flag(message=message, event_cause=EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED),
-            EventCause.SAFETY_CAR_ENDING: lambda message: self._process_track_flag(message=message, event_cause=EventCause.SAFETY_CAR_ENDING),
-            EventCause.VIRTUAL_SAFETY_CAR_ENDING: lambda message: self._process_track_flag(message=message, event_cause=EventCause.VIRTUAL_SAFETY_CAR_ENDING),
-
-            EventCause.SESSION_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.SESSION_START),
-            EventCause.SESSION_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.SESSION_END),
-            EventCause.SESSION_STOP: lambda message: self._process_session_notification(message=message, event_cause=EventCause.SESSION_STOP),
-            EventCause.SESSION_RESUME: lambda message: self._process_session_notification(message=message, event_cause=EventCause.SESSION_RESUME),
-            EventCause.PRACTICE_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.PRACTICE_START),
-            EventCause.PRACTICE_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.PRACTICE_END),
-            EventCause.Q1_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q1_START),
-            EventCause.Q1_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q1_END),
-            EventCause.Q2_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q2_START),
-            EventCause.Q2_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q2_END),
-            EventCause.Q3_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q3_START),
-            EventCause.Q3_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.Q3_END),
-            EventCause.RACE_START: lambda message: self._process_session_notification(message=message, event_cause=EventCause.RACE_START),
-            EventCause.RACE_END: lambda message: self._process_session_notification(message=message, event_cause=EventCause.RACE_END),
-
-            EventCause.RACE_CONTROL_MESSAGE: lambda message: self._process_race_control_message(message=message)
+            EventCause.BLACK_FLAG: partial(self._process_driver_flag, event_cause=EventCause.BLACK_FLAG),
+            EventCause.BLACK_AND_ORANGE_FLAG: partial(self._process_driver_flag, event_cause=EventCause.BLACK_AND_ORANGE_FLAG),
+            EventCause.BLACK_AND_WHITE_FLAG: partial(self._process_driver_flag, event_cause=EventCause.BLACK_AND_WHITE_FLAG),
+            EventCause.BLUE_FLAG: partial(self._process_driver_flag, event_cause=EventCause.BLUE_FLAG),
+            EventCause.INCIDENT_VERDICT: self._process_incident_verdict,
+            EventCause.PROVISIONAL_CLASSIFICATION: self._process_provisional_classification,
+            EventCause.QUALIFYING_STAGE_CLASSIFICATION: self._process_qualifying_stage_classifications,
+
+            EventCause.GREEN_FLAG: self._process_green_flag,
+            EventCause.YELLOW_FLAG: partial(self._process_sector_flag, event_cause=EventCause.YELLOW_FLAG),
+            EventCause.DOUBLE_YELLOW_FLAG: partial(self._process_sector_flag, event_cause=EventCause.DOUBLE_YELLOW_FLAG),
+
+            EventCause.CHEQUERED_FLAG: partial(self._process_track_flag, event_cause=EventCause.CHEQUERED_FLAG),
+            EventCause.RED_FLAG: partial(self._process_track_flag, event_cause=EventCause.RED_FLAG),
+            EventCause.SAFETY_CAR_DEPLOYED: partial(self._process_track_flag, event_cause=EventCause.SAFETY_CAR_DEPLOYED),
+            EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED: partial(self._process_track_flag, event_cause=EventCause.VIRTUAL_SAFETY_CAR_DEPLOYED),
+            EventCause.SAFETY_CAR_ENDING: partial(self._process_track_flag, event_cause=EventCause.SAFETY_CAR_ENDING),
+            EventCause.VIRTUAL_SAFETY_CAR_ENDING: partial(self._process_track_flag, event_cause=EventCause.VIRTUAL_SAFETY_CAR_ENDING),
+
+            EventCause.SESSION_START: partial(self._process_session_notification, event_cause=EventCause.SESSION_START),
+            EventCause.SESSION_END: partial(self._process_session_notification, event_cause=EventCause.SESSION_END),
+            EventCause.SESSION_STOP: partial(self._process_session_notification, event_cause=EventCause.SESSION_STOP),
+            EventCause.SESSION_RESUME: partial(self._process_session_notification, event_cause=EventCause.SESSION_RESUME),
+            EventCause.PRACTICE_START: partial(self._process_session_notification, event_cause=EventCause.PRACTICE_START),
+            EventCause.PRACTICE_END: partial(self._process_session_notification, event_cause=EventCause.PRACTICE_END),
+            EventCause.Q1_START: partial(self._process_session_notification, event_cause=EventCause.Q1_START),
+            EventCause.Q1_END: partial(self._process_session_notification, event_cause=EventCause.Q1_END),
+            EventCause.Q2_START: partial(self._process_session_notification, event_cause=EventCause.Q2_START),
+            EventCause.Q2_END: partial(self._process_session_notification, event_cause=EventCause.Q2_END),
+            EventCause.Q3_START: partial(self._process_session_notification, event_cause=EventCause.Q3_START),
+            EventCause.Q3_END: partial(self._process_session_notification, event_cause=EventCause.Q3_END),
+            EventCause.RACE_START: partial(self._process_session_notification, event_cause=EventCause.RACE_START),
+            EventCause.RACE_END: partial(self._process_session_notification, event_cause=EventCause.RACE_END),
+
+            EventCause.RACE_CONTROL_MESSAGE: self._process_race_control_message
         }
 
 
-    def process_message(self, message: Message) -> Iterator[Event]:
-        match (message.topic):
-            case "LapCount":
-                self._update_lap_number(message)
-            case "PitLaneTimeCollection":
-                # PitLaneTimeCollection acts as a fallback in case PitStopSeries doesn't exist or doesn't have a corresponding message
-                # Need to mark pit stop time as stale if latest pit date is not within some delta of message date for PitLaneTimeCollection
-                self._update_driver_pits(message)
-            case "PitStopSeries":
-                # Contains pit stop time, used from the 2024 US GP onwards
-                # Need to mark pit stop time as not stale
-                self._update_driver_pits(message)
-            case "Position.z":
-                self._update_driver_locations(message)
-            case "SessionData":
-                self._update_session_stream_start(message)
-                if self.session_type == "Qualifying":
-                    self._update_qualifying_stage_number(message)
-            case "SessionInfo":
-                self._update_session_info(message)
-            case "TimingAppData":
-                self._update_driver_stints(message)
-            case "TimingData":
-                self._update_driver_personal_best_laps(message)
-                self._update_driver_positions(message)
-            case _:
-                pass
-            
-        # Find event cause corresponding to message
-        event_cause = next(
-            (event_cause for event_cause, cond in self._get_event_condition_map().items()
-                if cond(message)
-            ),
-            None
-        )
+    def _dispatch_race_control_message(self, message: Message) -> Iterator[Event]:
+        fields = _get_race_control_fields(message.content)
+        event_cause = self._classify_race_control_message(fields)
 
         if event_cause is None:
             # Not an event message
             return
-        
-        yield from self._get_event_processing_map().get(event_cause)(message)
 
-        
\ No newline at end of file
+        yield from self._event_processors[event_cause](message, fields)
+
+
+    def _dispatch_session_data_message(self, message: Message) -> Iterator[Event]:
+        event_cause = self._classify_session_data_message(message)
+
+        if event_cause is None:
+            # Not an event message
+            return
+
+        yield from self._event_processors[event_cause](message)
+
+
+    def _dispatch_by_conditions(self, message: Message) -> Iterator[Event]:
+        for event_cause, cond in self._event_conditions[message.topic].items():
+            if cond(message):
+                yield from self._event_processors[event_cause](message)
+                return
+
+        # Not an event message
+
+
+    def process_message(self, message: Message) -> Iterator[Event]:
+        topic_updater = self._topic_updaters.get(message.topic)
+        if topic_updater is not None:
+            topic_updater(message)
+
+        # Find event cause corresponding to message, only checking causes for the message topic
+        event_dispatcher = self._event_dispatchers.get(message.topic)
+        if event_dispatcher is None:
+            # Topic does not produce events
+            return
+
+        yield from event_dispatcher(message)
+
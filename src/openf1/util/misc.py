@@ -62,19 +62,32 @@ def json_serializer(obj):
 def deep_get(obj: Any, key: Any) -> Any:
     """
     This function was adapted from https://stackoverflow.com/a/9808122.
-    Returns the first value indexed by the given key in an arbitrarily nested JSON-serializable object.
+    Returns the first value indexed by the given key in an arbitrarily nested JSON-serializable object,
     otherwise returns None.
+    Keys of a container are checked before its nested containers are searched. The traversal is
+    iterative to avoid recursion overhead on deeply nested messages.
     """
-    for k, v in (
-        obj.items() if isinstance(obj, dict) else
-        enumerate(obj) if isinstance(obj, list) else
-        []
-    ):
-        if k == key:
-            return v
-        elif isinstance(v, (dict, list)):
-            return deep_get(v, key)
-        
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            # Hashed lookup instead of comparing against every key
+            if key in current:
+                return current[key]
+            nested = [v for v in current.values() if isinstance(v, (dict, list))]
+        elif isinstance(current, list):
+            nested = []
+            for k, v in enumerate(current):
+                if k == key:
+                    return v
+                elif isinstance(v, (dict, list)):
+                    nested.append(v)
+        else:
+            continue
+
+        # Search nested containers in order
+        stack.extend(reversed(nested))
+
     return None
 
 
@@ -184,8 +197,7 @@ def to_timedelta(x: Any) -> timedelta | None:
                 microseconds=int(msus),
             )
 
-        except Exception as exc:
-            print(f"Failed to parse timedelta string '{x}'", exc_info=exc)
+        except Exception:
             return None
 
     elif isinstance(x, timedelta):